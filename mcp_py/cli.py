@@ -1,28 +1,198 @@
-import argparse
-import json
+import errno
 import os
-import subprocess
+import sys
 from pathlib import Path
 
 
+_orjson = False
+
+
+def _get_orjson():
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        _orjson = orjson
+    return _orjson
+
+
+def _json_loads(data: bytes):
+    orjson = _get_orjson()
+    if orjson is None:
+        import json
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    orjson = _get_orjson()
+    if orjson is None:
+        import json
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
+_DEFAULT_INDEX_TS = "import { MCPServer } from 'mcp-framework';\n\nconst server = new MCPServer();\n\nserver.start();\n".encode("utf-8")
+
+_EXAMPLE_TOOL_TS = (
+    "import { MCPTool } from 'mcp-framework';\n"
+    "import { z } from 'zod';\n\n"
+    "interface ExampleInput {\n  message: string;\n}\n\n"
+    "class ExampleTool extends MCPTool<ExampleInput> {\n"
+    "  name = 'example_tool';\n"
+    "  description = 'An example tool that processes messages';\n\n"
+    "  schema = {\n"
+    "    message: {\n"
+    "      type: z.string(),\n"
+    "      description: 'Message to process'\n"
+    "    }\n"
+    "  };\n\n"
+    "  async execute(input: ExampleInput) {\n"
+    "    return `Processed: ${input.message}`;\n"
+    "  }\n"
+    "}\n\nexport default ExampleTool;\n"
+).encode("utf-8")
+
+_TOOL_TEMPLATE = (
+    "import {{ MCPTool }} from 'mcp-framework';\n"
+    "import {{ z }} from 'zod';\n\n"
+    "interface {class_name}Input {{\n  message: string;\n}}\n\n"
+    "class {class_name}Tool extends MCPTool<{class_name}Input> {{\n"
+    "  name = '{name}';\n"
+    "  description = '{class_name} tool description';\n\n"
+    "  schema = {{\n"
+    "    message: {{\n"
+    "      type: z.string(),\n"
+    "      description: 'Message to process'\n"
+    "    }}\n"
+    "  }};\n\n"
+    "  async execute(input: {class_name}Input) {{\n"
+    "    return `Processed: ${{input.message}}`;\n"
+    "  }}\n"
+    "}}\n\nexport default {class_name}Tool;\n"
+)
+
+_PROMPT_TEMPLATE = (
+    "import {{ MCPPrompt }} from 'mcp-framework';\n"
+    "import {{ z }} from 'zod';\n\n"
+    "interface {class_name}Input {{\n  message: string;\n}}\n\n"
+    "class {class_name}Prompt extends MCPPrompt<{class_name}Input> {{\n"
+    "  name = '{name}';\n"
+    "  description = '{class_name} prompt description';\n\n"
+    "  schema = {{\n"
+    "    message: {{\n"
+    "      type: z.string(),\n"
+    "      description: 'Message to process',\n"
+    "      required: true\n"
+    "    }}\n"
+    "  }};\n\n"
+    "  async generateMessages({{ message }}: {class_name}Input) {{\n"
+    "    return [{{ role: 'user', content: {{ type: 'text', text: message }} }}];\n"
+    "  }}\n"
+    "}}\n\nexport default {class_name}Prompt;\n"
+)
+
+_RESOURCE_TEMPLATE = (
+    "import {{ MCPResource, ResourceContent }} from 'mcp-framework';\n\n"
+    "class {class_name}Resource extends MCPResource {{\n"
+    "  uri = 'resource://{name}';\n"
+    "  name = '{class_name}';\n"
+    "  description = '{class_name} resource description';\n"
+    "  mimeType = 'application/json';\n\n"
+    "  async read(): Promise<ResourceContent[]> {{\n"
+    "    return [{{ uri: this.uri, mimeType: this.mimeType, text: JSON.stringify({{ message: 'Hello from {class_name} resource' }}) }}];\n"
+    "  }}\n"
+    "}}\n\nexport default {class_name}Resource;\n"
+)
+
+_TEMPLATES = {
+    'tool': _TOOL_TEMPLATE,
+    'prompt': _PROMPT_TEMPLATE,
+    'resource': _RESOURCE_TEMPLATE
+}
+
+_COMPONENT_DIRS = {
+    'tool': Path('src/tools'),
+    'prompt': Path('src/prompts'),
+    'resource': Path('src/resources')
+}
+
+
+def _node_env() -> dict[str, str]:
+    env = os.environ.copy()
+    env.setdefault("NODE_COMPILE_CACHE", str(Path.home() / ".cache" / "node-compile"))
+    return env
+
+
+def _write(path: str | Path, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _prompt(label: str) -> str:
+    if sys.stdin is None or not sys.stdin.isatty():
+        return ""
+    sys.stdout.write(f"{label}: ")
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
+
+_SEP = str.maketrans('_', '-')
+
+_NPX = "npx.cmd" if os.name == "nt" else "npx"
+_NPM = "npm.cmd" if os.name == "nt" else "npm"
+_TSC_CMD = (_NPX, "tsc")
+_MCP_BUILD_CMD = (_NPX, "mcp-build")
+_NPM_INSTALL_CMD = (_NPM, "install", "--prefer-offline", "--no-audit", "--no-fund", "--loglevel=error")
+
+_IGNORED_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
+
+_pkg_cache: dict[Path, Path | None] = {}
+
+
 def find_package_json(start: Path) -> Path | None:
+    visited = []
     current = start
     while True:
+        if current in _pkg_cache:
+            result = _pkg_cache[current]
+            break
+        visited.append(current)
         candidate = current / "package.json"
-        if candidate.exists():
-            return candidate
+        try:
+            os.stat(candidate)
+        except OSError as e:
+            if e.errno not in _IGNORED_ERRNOS:
+                raise
+        else:
+            result = candidate
+            break
         if current.parent == current:
-            return None
+            result = None
+            break
         current = current.parent
+    for directory in visited:
+        _pkg_cache[directory] = result
+    return result
 
 
 def build_framework() -> None:
+    import shutil
+    import subprocess
+
     print("MCP Build Script Starting...")
     print("Finding project root...")
-    start_dir = Path.cwd()
-    print(f"Starting search from: {start_dir}")
+    cwd = Path(os.getcwd())
+    print(f"Starting search from: {cwd}")
 
-    pkg_path = find_package_json(start_dir)
+    pkg_path = find_package_json(cwd)
     if not pkg_path:
         raise RuntimeError("Could not find package.json in current directory or any parent directories")
 
@@ -31,42 +201,51 @@ def build_framework() -> None:
     if skip_validation:
         print("Skipping dependency validation")
     else:
-        pkg = json.loads(pkg_path.read_text())
-        if "mcp-framework" not in pkg.get("dependencies", {}):
-            raise RuntimeError("This directory is not an MCP project (mcp-framework not found in dependencies)")
+        pkg_bytes = pkg_path.read_bytes()
+        if b'"mcp-framework"' not in pkg_bytes or b'"dependencies"' not in pkg_bytes:
+            pkg = _json_loads(pkg_bytes)
+            if "mcp-framework" not in pkg.get("dependencies", {}):
+                raise RuntimeError("This directory is not an MCP project (mcp-framework not found in dependencies)")
 
     print(f"Running tsc in {project_root}")
-    cmd = ["npx", "tsc"] if os.name != "nt" else ["npx.cmd", "tsc"]
-    subprocess.check_call(cmd, cwd=project_root)
+    subprocess.check_call(_TSC_CMD, cwd=project_root, env=_node_env(), stdin=subprocess.DEVNULL, close_fds=True)
 
     dist_path = project_root / "dist"
     index_path = dist_path / "index.js"
-    shebang = "#!/usr/bin/env node\n"
+    shebang = b"#!/usr/bin/env node\n"
     if index_path.exists():
-        content = index_path.read_text()
-        if not content.startswith(shebang):
-            index_path.write_text(shebang + content)
+        with open(index_path, "rb") as f:
+            head = f.read(len(shebang))
+        if head != shebang:
+            tmp_path = index_path.with_name(index_path.name + ".tmp")
+            try:
+                with open(index_path, "rb") as src, open(tmp_path, "wb") as dst:
+                    dst.write(shebang)
+                    shutil.copyfileobj(src, dst)
+                shutil.copymode(index_path, tmp_path)
+                os.replace(tmp_path, index_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
     print("Build completed successfully!")
 
 
 def create_project(name: str | None, http: bool = False, cors: bool = False, port: int = 8080,
                     install: bool = True, example: bool = True) -> None:
+    cwd = Path(os.getcwd())
     if not name:
-        name = input("Project name: ").strip()
+        name = _prompt("Project name")
     if not name:
         raise RuntimeError("Project name is required")
 
-    project_dir = Path.cwd() / name
-    src_dir = project_dir / "src"
-    tools_dir = src_dir / "tools"
-    prompts_dir = src_dir / "prompts"
-    resources_dir = src_dir / "resources"
-
-    project_dir.mkdir(parents=True, exist_ok=True)
-    src_dir.mkdir(exist_ok=True)
-    tools_dir.mkdir(exist_ok=True)
-    prompts_dir.mkdir(exist_ok=True)
-    resources_dir.mkdir(exist_ok=True)
+    project_root = os.fspath(cwd / name)
+    src_dir = os.path.join(project_root, "src")
+    tools_dir = os.path.join(src_dir, "tools")
+    prompts_dir = os.path.join(src_dir, "prompts")
+    resources_dir = os.path.join(src_dir, "resources")
 
     package_json = {
         "name": name,
@@ -106,90 +285,102 @@ def create_project(name: str | None, http: bool = False, cors: bool = False, por
         if cors:
             transport_config += ",\n      cors: {\n        allowOrigin: '*'\n      }"
         transport_config += "\n    }\n  }"
-        index_ts = f"import {{ MCPServer }} from 'mcp-framework';\n\nconst server = new MCPServer({{{transport_config}}});\n\nserver.start();\n"
+        index_ts = f"import {{ MCPServer }} from 'mcp-framework';\n\nconst server = new MCPServer({{{transport_config}}});\n\nserver.start();\n".encode("utf-8")
     else:
-        index_ts = "import { MCPServer } from 'mcp-framework';\n\nconst server = new MCPServer();\n\nserver.start();\n"
+        index_ts = _DEFAULT_INDEX_TS
 
     files = [
-        (project_dir / "package.json", json.dumps(package_json, indent=2)),
-        (project_dir / "tsconfig.json", json.dumps(tsconfig, indent=2)),
-        (project_dir / "README.md", f"# {name}\n\nCreated with mcp-framework"),
-        (src_dir / "index.ts", index_ts)
+        (os.path.join(project_root, "package.json"), _json_dumps(package_json)),
+        (os.path.join(project_root, "tsconfig.json"), _json_dumps(tsconfig)),
+        (os.path.join(project_root, "README.md"), f"# {name}\n\nCreated with mcp-framework".encode("utf-8")),
+        (os.path.join(src_dir, "index.ts"), index_ts)
     ]
 
     if example:
-        example_tool = (
-            tools_dir / "ExampleTool.ts",
-            "import { MCPTool } from 'mcp-framework';\n"
-            "import { z } from 'zod';\n\n"
-            "interface ExampleInput {\n  message: string;\n}\n\n"
-            "class ExampleTool extends MCPTool<ExampleInput> {\n"
-            "  name = 'example_tool';\n"
-            "  description = 'An example tool that processes messages';\n\n"
-            "  schema = {\n"
-            "    message: {\n"
-            "      type: z.string(),\n"
-            "      description: 'Message to process'\n"
-            "    }\n"
-            "  };\n\n"
-            "  async execute(input: ExampleInput) {\n"
-            "    return `Processed: ${input.message}`;\n"
-            "  }\n"
-            "}\n\nexport default ExampleTool;\n"
-        )
-        files.append(example_tool)
+        files.append((os.path.join(tools_dir, "ExampleTool.ts"), _EXAMPLE_TOOL_TS))
 
-    for path, content in files:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
+    os.makedirs(project_root, exist_ok=True)
+    dirs = {os.path.dirname(path) for path, _ in files} | {tools_dir, prompts_dir, resources_dir}
+    dirs.discard(project_root)
+    for directory in sorted(dirs, key=len):
+        os.makedirs(directory, exist_ok=True)
 
-    os.chdir(project_dir)
-    subprocess.check_call(["git", "init"])
+    for path, content in files:
+        try:
+            with open(path, "rb") as f:
+                existing = f.read()
+        except FileNotFoundError:
+            existing = None
+        if existing != content:
+            tmp_path = path + ".tmp"
+            try:
+                _write(tmp_path, content)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    import subprocess
+
+    env = _node_env()
+    env["MCP_SKIP_VALIDATION"] = "true"
+    env["npm_config_cache"] = os.environ.get("MCP_NPM_CACHE") or os.environ.get(
+        "npm_config_cache", str(Path.home() / ".cache" / "mcp-npm"))
+    env.setdefault("npm_config_progress", "false")
+    run_kwargs = {"cwd": project_root, "env": env, "stdin": subprocess.DEVNULL, "close_fds": True}
+
+    procs = []
+    try:
+        procs.append(subprocess.Popen(["git", "init", "-q"], **run_kwargs))
+        if install:
+            procs.append(subprocess.Popen(_NPM_INSTALL_CMD, **run_kwargs))
+        for proc in procs:
+            if proc.wait() != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
+        if install:
+            subprocess.check_call(_TSC_CMD, **run_kwargs)
+            subprocess.check_call(_MCP_BUILD_CMD, **run_kwargs)
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait()
 
     if install:
-        subprocess.check_call(["npm", "install"])
-        subprocess.check_call(["npx", "tsc"], cwd=project_dir)
-        env = os.environ.copy()
-        env["MCP_SKIP_VALIDATION"] = "true"
-        subprocess.check_call(["npx", "mcp-build"], cwd=project_dir, env=env)
         print(f"Project {name} created and built successfully!")
     else:
         print(f"Project {name} created successfully (without dependencies)!")
 
 
 def to_pascal_case(value: str) -> str:
-    return ''.join(word.capitalize() for word in value.replace('_', '-').split('-'))
+    return ''.join(word[:1].upper() + word[1:] for word in value.translate(_SEP).split('-') if word)
 
 
 def add_component(name: str | None, kind: str) -> None:
-    pkg = find_package_json(Path.cwd())
+    cwd = Path(os.getcwd())
+    pkg = find_package_json(cwd)
     if not pkg:
         raise RuntimeError("Must be run from an MCP project directory")
     if not name:
-        name = input(f"{kind.capitalize()} name: ").strip()
+        name = _prompt(f"{kind.capitalize()} name")
     if not name:
         raise RuntimeError(f"{kind.capitalize()} name is required")
 
     class_name = to_pascal_case(name)
     file_name = f"{class_name}{kind.capitalize()}.ts"
-    dir_map = {
-        'tool': Path.cwd() / 'src/tools',
-        'prompt': Path.cwd() / 'src/prompts',
-        'resource': Path.cwd() / 'src/resources'
-    }
-    content_map = {
-        'tool': f"import {{ MCPTool }} from 'mcp-framework';\nimport {{ z }} from 'zod';\n\ninterface {class_name}Input {{\n  message: string;\n}}\n\nclass {class_name}Tool extends MCPTool<{class_name}Input> {{\n  name = '{name}';\n  description = '{class_name} tool description';\n\n  schema = {{\n    message: {{\n      type: z.string(),\n      description: 'Message to process'\n    }}\n  }};\n\n  async execute(input: {class_name}Input) {{\n    return `Processed: ${input.message}`;\n  }}\n}}\n\nexport default {class_name}Tool;\n",
-        'prompt': f"import {{ MCPPrompt }} from 'mcp-framework';\nimport {{ z }} from 'zod';\n\ninterface {class_name}Input {{\n  message: string;\n}}\n\nclass {class_name}Prompt extends MCPPrompt<{class_name}Input> {{\n  name = '{name}';\n  description = '{class_name} prompt description';\n\n  schema = {{\n    message: {{\n      type: z.string(),\n      description: 'Message to process',\n      required: true\n    }}\n  }};\n\n  async generateMessages({{ message }}: {class_name}Input) {{\n    return [{{ role: 'user', content: {{ type: 'text', text: message }} }}];\n  }}\n}}\n\nexport default {class_name}Prompt;\n",
-        'resource': f"import {{ MCPResource, ResourceContent }} from 'mcp-framework';\n\nclass {class_name}Resource extends MCPResource {{\n  uri = 'resource://{name}';\n  name = '{class_name}';\n  description = '{class_name} resource description';\n  mimeType = 'application/json';\n\n  async read(): Promise<ResourceContent[]> {{\n    return [{{ uri: this.uri, mimeType: this.mimeType, text: JSON.stringify({{ message: 'Hello from {class_name} resource' }}) }}];\n  }}\n}}\n\nexport default {class_name}Resource;\n"
-    }
-    target_dir = dir_map[kind]
+    target_dir = cwd / _COMPONENT_DIRS[kind]
     target_dir.mkdir(parents=True, exist_ok=True)
     file_path = target_dir / file_name
-    file_path.write_text(content_map[kind])
-    print(f"{kind.capitalize()} {name} created at {file_path.relative_to(Path.cwd())}")
+    _write(file_path, _TEMPLATES[kind].format(name=name, class_name=class_name).encode("utf-8"))
+    print(f"{kind.capitalize()} {name} created at {file_path.relative_to(cwd)}")
 
 
-def main(argv: list[str] | None = None) -> None:
+def _build_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(prog='mcp', description='CLI for managing MCP server projects')
     subparsers = parser.add_subparsers(dest='command')
 
@@ -209,6 +400,22 @@ def main(argv: list[str] | None = None) -> None:
         p = add_sub.add_parser(kind)
         p.add_argument('name', nargs='?')
 
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if not any(arg.startswith('-') for arg in argv):
+        if argv == ['build']:
+            build_framework()
+            return
+        if argv[:1] == ['add'] and len(argv) in (2, 3) and argv[1] in ('tool', 'prompt', 'resource'):
+            add_component(argv[2] if len(argv) == 3 else None, argv[1])
+            return
+
+    parser = _build_parser()
     args = parser.parse_args(argv)
 
     if args.command == 'build':